@@ -11,6 +11,11 @@ self.wait(sec) --> This methode stops the progression of the graph paper for <se
 self.markMainPoint() --> This methode indicates the (0,0) point of the graph paper.
 self.mark(x,y) --> This methode draws a Dot on the (x,y) point of the graph paper. [Parameter:Type]=[x,y:float,float]
 self.joinDots() --> This methode joins the Dots on the graph paper according to their serial of marking on the paper.
+self.plotEquation(equation,step,start,end) --> Plots and joins the graph of an equation string like "x^2+3x-1" (^, implicit multiplication, sin, cos, tan, sqrt, log, exp, abs, pi, e are supported, "sin 2x" means sin(2x) and "sin x cos x" means sin(x)cos(x)). At most 100000 points are sampled in one call. Only the points of this equation are joined and the line is broken where the equation is undefined. The equation defaults to the title and the range to the visible X axis. Parsed equations and sampled points are cached, so plotting the same equation again is fast. [Parameter:Type]=[equation,step,start,end:str,float,float,float]
+self.loadSeries(path,xColumn,yColumn,columns,delimiter,skipRows,offset,chunkSize,binary,join,keep,background,budget,onProgress) --> Marks every point of a CSV file or of a raw float64 file (<columns> values per record) chunk by chunk, so big files are never read at once. Files ending with .bin, .raw or .f64 (or binary=True) are read as memory-mapped float64, every other file as CSV. Points falling on the same pixels are drawn once, so the drawing does not grow with the file. Pass xColumn=None to use the row number as X, join=True to join the dots while loading and keep=True to also store the drawn dots for joinDots() (the memory then grows with the file). Returns the number of points read, or a RenderJob when background=True (its total is known for binary files). [Parameter:Type]=[path,xColumn,yColumn,columns,delimiter,skipRows,offset,chunkSize,binary,join,keep,background,budget,onProgress:str,int,int,int,str,int,int,int,bool,bool,bool,bool,float,function]
+self.markAsync(points,join,keep,budget,onProgress) --> Marks a list of (x,y) points in the background, drawing for at most <budget> seconds on each tick of the window so it keeps responding. Like loadSeries(), points falling on the same pixels are drawn once and keep=True also stores the drawn dots for joinDots(). While such a job runs, anything else storing dots (mark(), joinDots(), plotEquation(), saveState(), loadState()) raises GraphicsError. Returns a RenderJob with progress, fraction(), cancel(), done(), wait() and result(); onProgress(job) is called after every tick. [Parameter:Type]=[points,join,keep,budget,onProgress:list,bool,bool,float,function]
+self.saveState(path) --> Saves the size, pixel units, origin, color of lines and every marked dot of the graph paper, series by series, into a compact binary file. [Parameter:Type]=[path:str]
+self.loadState(path,chunkSize) --> Redraws a graph paper saved by saveState() at once, without replaying every mark() and joinDots(). The graph paper must have the same size as the saved one. Returns the number of dots. [Parameter:Type]=[path,chunkSize:str,int]
 self.setPixelUnit(XUnit,YUnit) --> Sets the unit of X and Y axis accordingly . The unit is measured in pixels. [Parameter:Type]=[XUnit,YUnit:int,int]
 self.setColorOfLines(r,g,b) --> Sets the color of normal square lines in mixed form of RED,GREEN,BLUE paramed as r,g,b accordingly. [Parameter:Type]=[r,g,b:byte,byte,byte]
 self.waitUntilClick() --> Stops progress of graph paper until a click from mouse is detected.
@@ -26,7 +31,9 @@ Thanks to John Zelle and Others for designing the graphics library.
 
 """Embedding the needed objects or class and methodes from graphics.py"""
 #graphics.py by John Zelle
-import time, os, sys
+import time, os, sys, math, ast, csv, mmap, struct
+from functools import lru_cache
+from array import array
 
 try:  # import as appropriate for 2.x vs. 3.x
    import tkinter as tk
@@ -572,6 +579,353 @@ class Rectangle(_BBox):
 
 
 """Start of Graphpaper Object"""
+#Names which can be used inside an equation string given to plotEquation()
+
+_EQUATION_NAMES={
+	"sin":math.sin,"cos":math.cos,"tan":math.tan,
+	"asin":math.asin,"acos":math.acos,"atan":math.atan,
+	"sinh":math.sinh,"cosh":math.cosh,"tanh":math.tanh,
+	"sqrt":math.sqrt,"exp":math.exp,"log":math.log,"ln":math.log,
+	"log10":math.log10,"abs":abs,"floor":math.floor,"ceil":math.ceil,
+	"pi":math.pi,"e":math.e,
+}
+_EQUATION_FUNCTIONS=set(_EQUATION_NAMES)-set(["pi","e"])
+
+def _splitName(word):
+	#"xsin" --> ["x","sin"] , longest known name first
+	names=[]
+	while word:
+		for size in range(len(word),0,-1):
+			if word[:size]=="x" or word[:size] in _EQUATION_NAMES:
+				names.append(word[:size])
+				word=word[size:]
+				break
+		else:
+			raise GraphicsError("Unknown name \"{}\" in equation".format(word))
+	return names
+
+def _tokenizeEquation(equation):
+	tokens=[]
+	i=0
+	while i<len(equation):
+		char=equation[i]
+		if char.isspace():
+			i+=1
+		elif char.isdigit() or char==".":
+			j=i
+			while j<len(equation) and (equation[j].isdigit() or equation[j]=="."):
+				j+=1
+			tokens.append(("num",equation[i:j]))
+			i=j
+		elif char.isalpha():
+			j=i
+			while j<len(equation) and (equation[j].isalnum() or equation[j]=="_"):
+				j+=1
+			for name in _splitName(equation[i:j].lower()):
+				tokens.append(("name",name))
+			i=j
+		elif char in "+-*/^()":
+			tokens.append(("op",char))
+			i+=1
+		else:
+			raise GraphicsError("Illegal character \"{}\" in equation".format(char))
+	return tokens
+
+def _translateEquation(equation):
+	"""Turns an equation string like "x^2+3x-1" into the python expression "x**2.0+3.0*x-1.0"."""
+	equation=equation.split("=")[-1]
+	parts=[]
+	previous=None
+	depth=0
+	#bracket depths of functions written without brackets, as in "sin 2x", their argument
+	#goes on over the product following them and ends at +,-,*,/, a closing bracket or another function
+	pending=[]
+	def closePending():
+		while pending and pending[-1]==depth:
+			parts.append(")")
+			pending.pop()
+	for kind,value in _tokenizeEquation(equation):
+		isFunction=kind=="name" and value in _EQUATION_FUNCTIONS
+		afterFunction=previous is not None and previous[0]=="name" and previous[1] in _EQUATION_FUNCTIONS
+		endsValue=previous is not None and (previous[0]=="num" or previous==("op",")") or (previous[0]=="name" and not afterFunction))
+		if (kind=="op" and value in "+-*/" and endsValue) or value==")" or (isFunction and endsValue):
+			closePending()
+		if afterFunction:
+			if kind in ("num","name") or value in "+-":
+				parts.append("(")
+				pending.append(depth)
+			elif value!="(":
+				raise GraphicsError("\"{}\" needs an argument in the equation".format(previous[1]))
+		elif endsValue and (kind in ("num","name") or value=="("):
+			#implicit multiplication as in 3x, 2(x+1), (x+1)(x-1)
+			parts.append("*")
+		if kind=="num":
+			try:
+				#floats overflow instead of growing into huge integers as in 9^9^9
+				parts.append(repr(float(value)))
+			except ValueError:
+				raise GraphicsError("Bad number \"{}\" in equation".format(value))
+		else:
+			parts.append("**" if value=="^" else value)
+		if value=="(":
+			depth+=1
+		elif value==")":
+			depth-=1
+		previous=(kind,value)
+	if not parts:
+		raise GraphicsError("Empty equation")
+	if previous[0]=="name" and previous[1] in _EQUATION_FUNCTIONS:
+		raise GraphicsError("\"{}\" needs an argument in the equation".format(previous[1]))
+	parts.append(")"*len(pending))
+	return "".join(parts)
+
+def _checkEquation(tree,equation):
+	#Every function has to be called with one argument and every other name has to be a value
+	called=set()
+	for node in ast.walk(tree):
+		if isinstance(node,ast.Call):
+			if not isinstance(node.func,ast.Name) or node.func.id not in _EQUATION_FUNCTIONS or len(node.args)!=1 or node.keywords:
+				raise GraphicsError("Can't understand the equation \"{}\"".format(equation))
+			called.add(id(node.func))
+	for node in ast.walk(tree):
+		if isinstance(node,ast.Name):
+			if node.id in _EQUATION_FUNCTIONS and id(node) not in called:
+				raise GraphicsError("\"{}\" needs an argument in the equation".format(node.id))
+			if node.id!="x" and node.id not in _EQUATION_NAMES:
+				raise GraphicsError("Unknown name \"{}\" in equation".format(node.id))
+
+@lru_cache(maxsize=64)
+def _compileEquation(equation):
+	"""Parses an equation once and returns a function of x for it."""
+	try:
+		tree=ast.parse(_translateEquation(equation),mode="eval")
+	except SyntaxError:
+		raise GraphicsError("Can't understand the equation \"{}\"".format(equation))
+	_checkEquation(tree,equation)
+	code=compile(tree,"<equation>","eval")
+	names=dict(_EQUATION_NAMES)
+	names["__builtins__"]={}
+	def function(x):
+		names["x"]=x
+		return eval(code,names)
+	return function
+
+#Sampled points are big, so fewer of them are cached than compiled equations
+_MAX_SAMPLES=100000
+
+@lru_cache(maxsize=8)
+def _sampleEquation(equation,start,end,step):
+	"""Returns the (x,y) points of an equation in between start and end as runs
+	of consecutive points, split wherever the equation is undefined."""
+	count=int(round((end-start)/step))
+	if count>_MAX_SAMPLES:
+		raise GraphicsError("Too many points to plot, use a step of at least {}".format((end-start)/_MAX_SAMPLES))
+	function=_compileEquation(equation)
+	runs=[]
+	points=[]
+	for i in range(count+1):
+		x=start+i*step
+		try:
+			y=float(function(x))
+		except (ArithmeticError,ValueError,TypeError):
+			if points:
+				runs.append(tuple(points))
+				points=[]
+			continue
+		points.append((x,y))
+	if points:
+		runs.append(tuple(points))
+	return tuple(runs)
+
+#Readers used by loadSeries() to stream big files chunk by chunk
+_BINARY_EXTENSIONS=(".bin",".raw",".f64")
+
+def _keepRun(run,xs,ys):
+	#Appends the first, lowest, highest and last (index,x,y) point of a run, in their order
+	for index,x,y in sorted(set(run)):
+		xs.append(x)
+		ys.append(y)
+
+
+def _readBinarySeries(path,xColumn,yColumn,columns,offset,chunkSize):
+	"""Yields (xs,ys) chunks out of a raw little-endian float64 file with <columns> values in each record."""
+	recordSize=8*columns
+	with open(path,"rb") as file:
+		size=os.fstat(file.fileno()).st_size-offset
+		if size<recordSize:
+			return
+		memory=mmap.mmap(file.fileno(),0,access=mmap.ACCESS_READ)
+		try:
+			records=size//recordSize
+			for first in range(0,records,chunkSize):
+				count=min(chunkSize,records-first)
+				start=offset+first*recordSize
+				values=array("d")
+				values.frombytes(memory[start:start+count*recordSize])
+				if sys.byteorder=="big":
+					values.byteswap()
+				if xColumn is None:
+					xs=array("d",range(first,first+count))
+				else:
+					xs=values[xColumn::columns]
+				yield xs,values[yColumn::columns]
+		finally:
+			memory.close()
+
+def _sliceSeries(points,chunkSize):
+	"""Yields (xs,ys) chunks out of a list of (x,y) points."""
+	for start in range(0,len(points),chunkSize):
+		chunk=points[start:start+chunkSize]
+		yield array("d",[x for x,y in chunk]),array("d",[y for x,y in chunk])
+
+def _readCsvSeries(path,xColumn,yColumn,delimiter,skipRows,chunkSize):
+	"""Yields (xs,ys) chunks out of a CSV file, reading at most <chunkSize> rows at a time."""
+	with open(path,newline="") as file:
+		reader=csv.reader(file,delimiter=delimiter)
+		xs=array("d")
+		ys=array("d")
+		index=0
+		for row in reader:
+			if reader.line_num<=skipRows or not row:
+				continue
+			try:
+				xs.append(index if xColumn is None else float(row[xColumn]))
+				ys.append(float(row[yColumn]))
+			except (ValueError,IndexError):
+				raise GraphicsError("Bad row at line {} of {}".format(reader.line_num,path))
+			index+=1
+			if len(ys)==chunkSize:
+				yield xs,ys
+				xs=array("d")
+				ys=array("d")
+		if ys:
+			yield xs,ys
+
+#Snapshot layout of saveState()/loadState(): a header, one (offset,length,joined) entry per series,
+#then every X and every Y as little-endian float64
+_STATE_MAGIC=b"GPST"
+_STATE_VERSION=1
+_STATE_HEADER=struct.Struct("<4sHiiiidd7sIQ")
+_STATE_SERIES=struct.Struct("<QQ?")
+
+class RenderJob():
+	"""Draws chunks of dots on a GraphPaper a few at a time from the tkinter
+	event loop, so the window keeps repainting and can be closed meanwhile.
+	Each tick draws for at most <budget> seconds. Chunks are (xs,ys,count)
+	where count is the number of points the chunk stands for."""
+	batchSize=256
+	sliceSize=1024
+
+	def __init__(self,paper,chunks,join=False,keep=True,budget=0.008,onProgress=None,total=None):
+		self.paper=paper
+		self.chunks=iter(chunks)
+		self.join=join
+		self.keep=keep
+		self.budget=budget
+		self.onProgress=onProgress
+		self.total=total
+		self.progress=0
+		self.xs=self.ys=array("d")
+		self.chunkStart=0
+		self.chunkCount=0
+		self.position=0
+		self.last=None
+		self.error=None
+		self._done=False
+		self._cancelled=False
+		self.series=None
+		if keep:
+			self.paper._checkDotsFree("start another job keeping its dots")
+			self.series=self.paper._addSeries(0,join)
+			self.paper.keepingJobs_.append(self)
+		_root.after(1,self._step)
+
+	def __repr__(self):
+		state="cancelled" if self._cancelled else "done" if self._done else "running"
+		return "RenderJob({}, progress={}, total={})".format(state,self.progress,self.total)
+
+	def _finish(self,error=None):
+		self.error=error
+		self._done=True
+		if self in self.paper.keepingJobs_:
+			self.paper.keepingJobs_.remove(self)
+		close=getattr(self.chunks,"close",None)
+		if close:
+			close()
+
+	def _step(self):
+		if self._done:
+			return
+		if self.paper.win.isClosed():
+			self.cancel()
+			return
+		deadline=time.time()+self.budget
+		try:
+			while time.time()<deadline:
+				if self.position>=len(self.ys):
+					try:
+						xs,ys,count=next(self.chunks)
+					except StopIteration:
+						self._finish()
+						break
+					self.chunkStart+=self.chunkCount
+					self.xs,self.ys,self.chunkCount=xs,ys,count
+					self.position=0
+					if not ys:
+						self.progress=self.chunkStart+count
+					continue
+				end=min(self.position+self.batchSize,len(self.ys))
+				xs=self.xs[self.position:end]
+				ys=self.ys[self.position:end]
+				self.paper._drawDots(xs,ys)
+				if self.join:
+					self.last=self.paper._drawPath(xs,ys,self.last)
+				if self.keep:
+					self.paper.listOfDots_.extend([x,y] for x,y in zip(xs,ys))
+					self.series[1]+=end-self.position
+				self.position=end
+				self.progress=self.chunkStart+self.chunkCount*end//len(self.ys)
+			if self.onProgress:
+				self.onProgress(self)
+		except Exception as error:
+			self._finish(error)
+		if not self._done:
+			_root.after(1,self._step)
+
+	def fraction(self):
+		if not self.total:
+			return 1.0 if self._done else None
+		return min(self.progress/self.total,1.0)
+
+	def cancel(self):
+		if self._done:
+			return False
+		self._cancelled=True
+		self._finish()
+		return True
+
+	def cancelled(self):
+		return self._cancelled
+
+	def done(self):
+		return self._done
+
+	def wait(self):
+		while not self._done:
+			if self.paper.win.isClosed():
+				self.cancel()
+				break
+			_root.update()
+			time.sleep(.001)
+		return self.result()
+
+	def result(self):
+		if not self._done:
+			raise GraphicsError("Render job is still running")
+		if self.error is not None:
+			raise self.error
+		return self.progress
+
 class GraphPaper():
 	def __init__(self,screenHeight,screenWidth,title):
 		self.Height=screenHeight
@@ -586,6 +940,10 @@ class GraphPaper():
 		self.nH=1
 		self.nW=1
 		self.listOfDots_=[]
+		#[offset,length,joined] of every series of dots in listOfDots_, used by saveState()
+		self.listOfSeries_=[]
+		#running RenderJobs which store their dots, nothing else may change listOfDots_ meanwhile
+		self.keepingJobs_=[]
 		self.clrScr()
 
 	def __str__(self):
@@ -667,6 +1025,7 @@ class GraphPaper():
 		labelX.setSize(15)
 		labelX.draw(self.win)
 	def mark(self,x,y):
+		self._checkDotsFree("mark")
 		x2=(x+int(self.nW))*self.pixelUnitX
 		y2=(-y+int(self.nH))*self.pixelUnitY
 		marker=Rectangle(Point(x2-0.75,y2-0.75), Point(x2+0.5,y2+0.5))
@@ -675,8 +1034,11 @@ class GraphPaper():
 		marker.setWidth(3)
 		marker.draw(self.win)
 		self.listOfDots_.append([x,y])
+		self._addSeries(1,False)
 
 	def joinDots(self):
+		self._checkDotsFree("join the dots")
+		self.listOfSeries_=[[0,len(self.listOfDots_),True]]
 		listOfDots=self.listOfDots_
 		for i in range(len(listOfDots)):
 			global joiningLine
@@ -695,6 +1057,240 @@ class GraphPaper():
 			joiningLine.setWidth(1)
 			joiningLine.setOutline(color_rgb(255,0,0))
 			joiningLine.draw(self.win)
+	def plotEquation(self,equation=None,step=1,start=None,end=None):
+		self._checkDotsFree("plot an equation")
+		if equation is None:
+			equation=self.Title
+		if start is None:
+			start=-int(self.nW)
+		if end is None:
+			end=int(self.nW)
+		if step<=0:
+			raise GraphicsError("step must be positive")
+		for run in _sampleEquation(str(equation),float(start),float(end),float(step)):
+			xs=array("d",[x for x,y in run])
+			ys=array("d",[y for x,y in run])
+			self._drawDots(xs,ys)
+			self._drawPath(xs,ys)
+			self.listOfDots_.extend([x,y] for x,y in run)
+			self._addSeries(len(run),True)
+		if self.win.autoflush:
+			_root.update()
+
+	def _checkDotsFree(self,action):
+		if self.keepingJobs_:
+			raise GraphicsError("Can't {} while a background job is storing its dots, wait() or cancel() it first".format(action))
+
+	def _addSeries(self,count,joined):
+		#Records the last <count> dots of listOfDots_ as a series, unjoined dots in a row make one series
+		offset=len(self.listOfDots_)-count
+		if self.listOfSeries_:
+			previous=self.listOfSeries_[-1]
+			if not joined and not previous[2] and previous[0]+previous[1]==offset:
+				previous[1]+=count
+				return previous
+		series=[offset,count,joined]
+		self.listOfSeries_.append(series)
+		return series
+
+	def _drawDots(self,xs,ys):
+		#Same markers as mark() but straight on the canvas, flushing is left to the caller
+		if self.win.isClosed():
+			raise GraphicsError("Can't draw to closed window")
+		color=color_rgb(255,0,0)
+		offsetX=int(self.nW)
+		offsetY=int(self.nH)
+		for x,y in zip(xs,ys):
+			x2=(x+offsetX)*self.pixelUnitX
+			y2=(-y+offsetY)*self.pixelUnitY
+			self.win.create_rectangle(x2-0.75,y2-0.75,x2+0.5,y2+0.5,outline=color,fill=color,width=3)
+
+	def _drawPath(self,xs,ys,last=None):
+		#Joins the dots of a chunk with one polyline, starting from the last dot of the previous chunk
+		coords=[] if last is None else list(last)
+		offsetX=int(self.nW)
+		offsetY=int(self.nH)
+		for x,y in zip(xs,ys):
+			coords.append((x+offsetX)*self.pixelUnitX)
+			coords.append((-y+offsetY)*self.pixelUnitY)
+		if len(coords)>=4:
+			self.win.create_line(*coords,fill=color_rgb(255,0,0),width=1)
+		return coords[-2:] if coords else last
+
+	def _decimateChunks(self,chunks,join):
+		#Keeps only what can be seen, so the canvas does not grow with the file:
+		#joined series keep the first, lowest, highest and last point of every run of points in one pixel column,
+		#unjoined series keep one dot per visible pixel
+		#Points left or right of the window fall in its first or last column, so they collapse into
+		#the points where the line leaves and enters it. Runs go on over chunks.
+		offsetX=int(self.nW)
+		offsetY=int(self.nH)
+		drawn=set()
+		run=None
+		column=None
+		index=0
+		try:
+			for xs,ys in chunks:
+				keptXs=array("d")
+				keptYs=array("d")
+				for x,y in zip(xs,ys):
+					index+=1
+					pixelX=(x+offsetX)*self.pixelUnitX
+					pixelY=(-y+offsetY)*self.pixelUnitY
+					if pixelX!=pixelX or pixelY!=pixelY:
+						continue
+					if join:
+						pixelX=int(round(min(max(pixelX,0),self.Width)))
+						point=(index,x,y)
+						if pixelX!=column or run is None:
+							if run is not None:
+								_keepRun(run,keptXs,keptYs)
+							column=pixelX
+							run=[point,point,point,point]
+						else:
+							if y<run[1][2]:
+								run[1]=point
+							if y>run[2][2]:
+								run[2]=point
+							run[3]=point
+					else:
+						if not (0<=pixelX<=self.Width and 0<=pixelY<=self.Height):
+							continue
+						pixel=(int(round(pixelX)),int(round(pixelY)))
+						if pixel in drawn:
+							continue
+						drawn.add(pixel)
+						keptXs.append(x)
+						keptYs.append(y)
+				yield keptXs,keptYs,len(ys)
+			if run is not None:
+				keptXs=array("d")
+				keptYs=array("d")
+				_keepRun(run,keptXs,keptYs)
+				yield keptXs,keptYs,0
+		finally:
+			close=getattr(chunks,"close",None)
+			if close:
+				close()
+
+	def loadSeries(self,path,xColumn=0,yColumn=1,columns=2,delimiter=",",skipRows=0,offset=0,chunkSize=65536,binary=None,join=False,keep=False,background=False,budget=0.008,onProgress=None):
+		if binary is None:
+			binary=str(path).lower().endswith(_BINARY_EXTENSIONS)
+		if chunkSize<1:
+			raise GraphicsError("chunkSize must be at least 1")
+		for column in (xColumn,yColumn):
+			if column is not None and column<0:
+				raise GraphicsError("Column {} can't be negative".format(column))
+		if background:
+			#small chunks, so reading one fits in the time budget of a tick
+			chunkSize=min(chunkSize,RenderJob.sliceSize)
+		if binary:
+			for column in (xColumn,yColumn):
+				if column is not None and column>=columns:
+					raise GraphicsError("Column {} is out of the {} columns of a record".format(column,columns))
+			if offset<0:
+				raise GraphicsError("offset can't be negative")
+			chunks=_readBinarySeries(path,xColumn,yColumn,columns,offset,chunkSize)
+		else:
+			chunks=_readCsvSeries(path,xColumn,yColumn,delimiter,skipRows,chunkSize)
+		chunks=self._decimateChunks(chunks,join)
+		if background:
+			total=None
+			if binary:
+				total=max(os.path.getsize(path)-offset,0)//(8*columns)
+			return RenderJob(self,chunks,join,keep,budget,onProgress,total=total)
+		if keep:
+			self._checkDotsFree("keep the dots of a series")
+		series=self._addSeries(0,join) if keep else None
+		count=0
+		last=None
+		for xs,ys,read in chunks:
+			self._drawDots(xs,ys)
+			if join:
+				last=self._drawPath(xs,ys,last)
+			if keep:
+				self.listOfDots_.extend([x,y] for x,y in zip(xs,ys))
+				series[1]+=len(ys)
+			if self.win.autoflush:
+				_root.update()
+			count+=read
+		return count
+
+	def markAsync(self,points,join=False,keep=False,budget=0.008,onProgress=None):
+		points=list(points)
+		chunks=self._decimateChunks(_sliceSeries(points,RenderJob.sliceSize),join)
+		return RenderJob(self,chunks,join,keep,budget,onProgress,total=len(points))
+
+	def saveState(self,path):
+		self._checkDotsFree("save the state")
+		color=self.colorOfSubLines
+		if not (isinstance(color,str) and len(color)==7 and color[0]=="#" and all(c in "0123456789abcdefABCDEF" for c in color[1:])):
+			raise GraphicsError("Color of lines must be like #rrggbb to be saved, use setColorOfLines()")
+		xs=array("d",[dot[0] for dot in self.listOfDots_])
+		ys=array("d",[dot[1] for dot in self.listOfDots_])
+		if sys.byteorder=="big":
+			xs.byteswap()
+			ys.byteswap()
+		with open(path,"wb") as file:
+			file.write(_STATE_HEADER.pack(_STATE_MAGIC,_STATE_VERSION,self.Width,self.Height,self.pixelUnitX,self.pixelUnitY,self.nW,self.nH,color.encode("ascii"),len(self.listOfSeries_),len(xs)))
+			for offset,length,joined in self.listOfSeries_:
+				file.write(_STATE_SERIES.pack(offset,length,joined))
+			xs.tofile(file)
+			ys.tofile(file)
+
+	def loadState(self,path,chunkSize=65536):
+		self._checkDotsFree("load a state")
+		with open(path,"rb") as file:
+			header=file.read(_STATE_HEADER.size)
+			if len(header)!=_STATE_HEADER.size or header[:4]!=_STATE_MAGIC:
+				raise GraphicsError("{} is not a graph paper state file".format(path))
+			magic,version,width,height,XUnit,YUnit,nW,nH,color,seriesCount,count=_STATE_HEADER.unpack(header)
+			if version!=_STATE_VERSION:
+				raise GraphicsError("Unsupported state file version {}".format(version))
+			if (width,height)!=(self.Width,self.Height):
+				raise GraphicsError("{} was saved from a {}x{} graph paper, not {}x{}".format(path,width,height,self.Width,self.Height))
+			table=file.read(_STATE_SERIES.size*seriesCount)
+			if len(table)!=_STATE_SERIES.size*seriesCount:
+				raise GraphicsError("{} is truncated".format(path))
+			listOfSeries=[list(series) for series in _STATE_SERIES.iter_unpack(table)]
+			xs=array("d")
+			ys=array("d")
+			try:
+				xs.fromfile(file,count)
+				ys.fromfile(file,count)
+			except EOFError:
+				raise GraphicsError("{} is truncated".format(path))
+		for offset,length,joined in listOfSeries:
+			if offset+length>count:
+				raise GraphicsError("{} has a series out of its dots".format(path))
+		if sys.byteorder=="big":
+			xs.byteswap()
+			ys.byteswap()
+		self.colorOfSubLines=color.rstrip(b"\x00").decode("ascii")
+		self.pixelUnitX=XUnit
+		self.pixelUnitY=YUnit
+		if (nW,nH)==((self.Width//XUnit)/2,(self.Height//YUnit)/2):
+			self.setPixelUnit(XUnit,YUnit)
+		else:
+			#the paper was saved before its graph paper layout was made
+			self.clrScr()
+		self.nW=nW
+		self.nH=nH
+		self.listOfDots_=[[x,y] for x,y in zip(xs,ys)]
+		self.listOfSeries_=listOfSeries
+		for offset,length,joined in listOfSeries:
+			last=None
+			for start in range(offset,offset+length,chunkSize):
+				stop=min(start+chunkSize,offset+length)
+				chunkXs=xs[start:stop]
+				chunkYs=ys[start:stop]
+				self._drawDots(chunkXs,chunkYs)
+				if joined:
+					last=self._drawPath(chunkXs,chunkYs,last)
+		if self.win.autoflush:
+			_root.update()
+		return count
+
 	def setPixelUnit(self,XUnit,YUnit):
 		self.pixelUnitX=int(XUnit)
 		self.pixelUnitY=int(YUnit)